@@ -1,10 +1,12 @@
 """Main module for the FastAPI backend."""
 
 # Standard library imports
+import atexit
 import logging
 import os
+import queue
 import tempfile
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Set up logging
 log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -29,9 +31,14 @@ formatter = logging.Formatter(log_format)
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
 
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Route records through a queue; a listener thread does the console/file I/O
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on shutdown
 
 # Use logger instead of print
 logger.info("Starting backend server...")
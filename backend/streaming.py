@@ -43,8 +43,8 @@ class StreamProcessor:
         audio = np.concatenate(self.buffer)
         self.buffer.clear()
 
-        # Convert to float32 in [-1, 1] range
-        audio_np = audio.astype("float32")
+        # Stream is float32 in [-1, 1] already; only cast if that ever changes
+        audio_np = audio.astype("float32", copy=False)
 
         result = mlx_whisper.transcribe(
             audio=audio_np, language="", temperature=0.0, task="transcribe"
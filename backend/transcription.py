@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 from unittest.mock import patch
 
@@ -29,6 +30,10 @@ WHISPER_MODELS = {
 # Model cache
 _loaded_models = {}
 
+# Background model loads started by preload_model()
+_preload_executor = ThreadPoolExecutor(max_workers=1)
+_pending_loads: dict[str, Future] = {}
+
 
 # Clean transcription text
 def clean_transcription(text: str) -> str:
@@ -41,6 +46,11 @@ def load_model(model_size: str):
     if model_size not in WHISPER_MODELS:
         raise ValueError(f"Unsupported model size: {model_size}")
 
+    pending = _pending_loads.pop(model_size, None)
+    if pending is not None:
+        # Wait for the background load instead of starting a second one
+        pending.result()
+
     if model_size not in _loaded_models:
         logger.info(f"Loading Whisper model: {model_size}")
         _loaded_models[model_size] = whisper.load_model(WHISPER_MODELS[model_size])
@@ -48,6 +58,28 @@ def load_model(model_size: str):
     return _loaded_models[model_size]
 
 
+def preload_model(model_size: str) -> Future:
+    """Start loading a Whisper model in the background.
+
+    The next load_model() call for the same size waits on this load
+    instead of blocking on a fresh one.
+    """
+    if model_size not in WHISPER_MODELS:
+        raise ValueError(f"Unsupported model size: {model_size}")
+
+    if model_size not in _pending_loads:
+        _pending_loads[model_size] = _preload_executor.submit(
+            _load_into_cache, model_size
+        )
+    return _pending_loads[model_size]
+
+
+def _load_into_cache(model_size: str) -> None:
+    if model_size not in _loaded_models:
+        logger.info(f"Preloading Whisper model: {model_size}")
+        _loaded_models[model_size] = whisper.load_model(WHISPER_MODELS[model_size])
+
+
 async def transcribe_audio(
     audio_path: str,
     model_size: str = "tiny",
@@ -13,12 +13,30 @@ from backend.transcription import transcribe_audio
 SAMPLE_RATE = 16000
 CHUNK_SIZE = 16000  # 1-second chunks
 MAX_DURATION = 30  # seconds
+INT16_SCALE = np.float32(1 / 32768.0)
 
 
 class AudioProcessor:
     def __init__(self):
         self.buffer = mx.array([], dtype=mx.float32)
         self.last_process_time = time.time()
+        # Reused downmix target so the audio callback doesn't allocate
+        self._mono = np.empty(CHUNK_SIZE, dtype=np.float32)
+
+    def to_mono(self, indata):
+        """Downmix a (frames, channels) int16 block into the reused float32 buffer"""
+        frames, channels = indata.shape
+        out = self._mono[:frames]
+        if channels == 1:
+            np.multiply(indata[:, 0], INT16_SCALE, out=out)
+        elif channels == 2:
+            # Sum in float32 so the int16 samples can't overflow
+            np.add(indata[:, 0], indata[:, 1], out=out, dtype=np.float32)
+            np.multiply(out, 0.5 * INT16_SCALE, out=out)
+        else:
+            np.mean(indata, axis=1, dtype=np.float32, out=out)
+            np.multiply(out, INT16_SCALE, out=out)
+        return out
 
     async def process_chunk(self, chunk_np):
         """Convert numpy to MLX array and transcribe"""
@@ -40,24 +58,33 @@ def main():
     print(f"Sample rate: {SAMPLE_RATE}Hz | Chunk size: {CHUNK_SIZE / SAMPLE_RATE:.1f}s")
 
     processor = AudioProcessor()
+    # Same channel count InputStream would pick by default; to_mono downmixes
+    channels = sd.query_devices(kind="input")["max_input_channels"]
 
     def callback(indata, frames, time_info, status):
         """Audio callback with memory-safe processing"""
         if status:
             print(f"Audio status: {status}")
 
+        # Raw int16 interleaved frames -> (frames, channels) view, no copy
+        mono = processor.to_mono(np.frombuffer(indata, np.int16).reshape(-1, channels))
+
         # Visual feedback
-        level = min(30, int(np.max(np.abs(indata)) * 50))
+        level = min(30, int(np.max(np.abs(mono)) * 50))
         print("■" * level + " " * (30 - level), end="\r")
 
         # Process chunk
-        asyncio.run(processor.process_chunk(indata))
+        asyncio.run(processor.process_chunk(mono))
 
     print("Press Enter to start recording...")
     input()
 
-    with sd.InputStream(
-        samplerate=SAMPLE_RATE, blocksize=CHUNK_SIZE, dtype="float32", callback=callback
+    with sd.RawInputStream(
+        samplerate=SAMPLE_RATE,
+        blocksize=CHUNK_SIZE,
+        channels=channels,
+        dtype="int16",
+        callback=callback,
     ):
         print(f"Recording (max {MAX_DURATION}s) - Press Enter to stop")
         input()
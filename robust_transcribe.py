@@ -1,7 +1,6 @@
 """Robust real-time transcription with proper MLX memory handling"""
 
 import asyncio
-import time
 
 import mlx.core as mx
 import numpy as np
@@ -9,6 +8,8 @@ import sounddevice as sd
 
 from backend.transcription import transcribe_audio
 
+INT16_SCALE = np.float32(1 / 32768.0)
+
 
 class AudioTranscriber:
     def __init__(self, model_size="base"):
@@ -16,6 +17,9 @@ class AudioTranscriber:
         self.sample_rate = 16000
         self.chunk_size = 16000  # 1-second chunks
         self.max_duration = 30  # seconds
+        self.max_batch = 16  # chunks merged into one transcription call
+        self.loop = None
+        self.queue = None
 
     async def process_chunk(self, audio_np):
         """Safely process audio chunk with MLX"""
@@ -33,7 +37,28 @@ class AudioTranscriber:
             print(f"\nError processing chunk: {str(e)}")
             return None
 
-    def run(self):
+    def _enqueue(self, chunk):
+        """Runs on the event loop; drops the chunk if the consumer is behind"""
+        try:
+            self.queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            print("\nDropping audio chunk - transcription is falling behind")
+
+    async def _consumer(self):
+        """Drain queued chunks and transcribe them as one batch until None"""
+        done = False
+        while not done:
+            batch = []
+            while len(batch) < self.max_batch and (not batch or not self.queue.empty()):
+                chunk = await self.queue.get()
+                if chunk is None:
+                    done = True
+                    break
+                batch.append(chunk)
+            if batch:
+                await self.process_chunk(np.concatenate(batch))
+
+    async def run(self):
         print(f"MLX Whisper Transcription (model: {self.model_size})\n")
         print(
             f"Sample rate: {self.sample_rate}Hz | Chunk size: {self.chunk_size / self.sample_rate:.1f}s"
@@ -44,28 +69,46 @@ class AudioTranscriber:
             if status:
                 print(f"\nAudio status: {status}")
 
+            # int16 -> float32 in one vectorized pass; this is also the copy
+            # that keeps the chunk alive after sounddevice reuses indata
+            chunk = np.multiply(
+                np.frombuffer(indata, dtype=np.int16), INT16_SCALE, dtype=np.float32
+            )
+
             # Visual feedback
-            level = min(30, int(np.max(np.abs(indata)) * 50))
+            level = min(30, int(np.max(np.abs(chunk)) * 50))
             print("■" * level + " " * (30 - level), end="\r")
 
-            # Process chunk in background
-            asyncio.create_task(self.process_chunk(indata))
+            # Hand off to the event loop
+            self.loop.call_soon_threadsafe(self._enqueue, chunk)
+
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=64)
 
         print("Press Enter to start recording...")
-        input()
+        await self.loop.run_in_executor(None, input)
 
-        with sd.InputStream(
+        consumer = asyncio.create_task(self._consumer())
+        with sd.RawInputStream(
             samplerate=self.sample_rate,
             blocksize=self.chunk_size,
-            dtype="float32",
+            channels=1,
+            dtype="int16",
             callback=callback,
         ):
             print(f"Recording (max {self.max_duration}s) - Press Enter to stop")
-            start_time = time.time()
-            while time.time() - start_time < self.max_duration:
-                if input() == "":  # Stop on Enter
-                    break
-
+            try:
+                await asyncio.wait_for(
+                    self.loop.run_in_executor(None, input), self.max_duration
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        # Let hand-offs already scheduled by the callback land, then tell the
+        # consumer to finish the backlog and exit
+        await asyncio.sleep(0)
+        await self.queue.put(None)
+        await consumer
         print("\nTranscription complete")
 
 
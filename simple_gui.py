@@ -6,6 +6,9 @@ import sounddevice as sd
 
 from backend.transcription import transcribe_audio
 
+SAMPLE_RATE = 16000  # Whisper's native rate, so no resampling downstream
+INITIAL_BUFFER_SECONDS = 60  # Recording buffer grows by doubling past this
+
 
 class WhisperGUI:
     def __init__(self, root):
@@ -36,15 +39,24 @@ class WhisperGUI:
         self.status.pack(fill=tk.X)
 
         self.recording = False
-        self.frames = []
+        self.buffer = None
+        self.n_frames = 0
 
     def toggle_recording(self):
         if not self.recording:
             self.recording = True
             self.record_btn.config(text="Stop Recording")
             self.status.config(text="Recording...")
-            self.frames = []
-            self.stream = sd.InputStream(callback=self.audio_callback)
+            self.stream = sd.InputStream(
+                samplerate=SAMPLE_RATE,
+                channels=1,
+                dtype="float32",
+                callback=self.audio_callback,
+            )
+            self.buffer = np.empty(
+                SAMPLE_RATE * INITIAL_BUFFER_SECONDS, dtype=np.float32
+            )
+            self.n_frames = 0
             self.stream.start()
         else:
             self.recording = False
@@ -53,11 +65,23 @@ class WhisperGUI:
             self.transcribe()
 
     def audio_callback(self, indata, frames, time, status):
-        self.frames.append(indata.copy())
+        end = self.n_frames + frames
+        if end > len(self.buffer):
+            grown = np.empty(2 * end, dtype=np.float32)
+            grown[: self.n_frames] = self.buffer[: self.n_frames]
+            self.buffer = grown
+        self.buffer[self.n_frames : end] = indata[:, 0]
+        self.n_frames = end
 
     def transcribe(self):
+        """Transcribe the recording as contiguous 1-D float32 audio.
+
+        The stream is opened as 16 kHz mono float32, so the filled part of
+        the buffer already has the layout Whisper consumes and is passed
+        as a view without further conversion.
+        """
         try:
-            audio = np.concatenate(self.frames)
+            audio = self.buffer[: self.n_frames]
             result = transcribe_audio(audio, model=self.model_var.get())
             self.text.insert(tk.END, result["text"] + "\n")
             self.status.config(text="Done")
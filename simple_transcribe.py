@@ -1,11 +1,13 @@
 import asyncio
+import queue
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import sounddevice as sd
 
-from backend.transcription import transcribe_audio
+from backend.transcription import preload_model, transcribe_audio
 
 # Configure audio settings at the top of the file
 default_device = 0  # MacBook Air Microphone
@@ -15,26 +17,44 @@ max_mb = 100  # Max MB per chunk
 chunk_samples = 16000  # Process 1-second chunks (fs * 1s)
 max_chunks = 30  # 30 seconds max
 
+# Level meter lines, indexed by level so the callback builds no strings
+BARS = [("■" * i).ljust(30) + "\r" for i in range(31)]
+
 
 def record_and_transcribe():
+    # Load weights while waiting for the user to start recording
+    preload_model("base")
+
     print("Press Enter to start recording...")
     input()
 
+    # One event loop for the whole session instead of asyncio.run() per chunk
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
     try:
         sd.default.device = default_device
         print(f"Using default microphone: {sd.query_devices(default_device)['name']}")
 
-        recording = []
+        # Preallocated recording: one row per chunk, filled by the callback
+        ring = np.empty((max_chunks, chunk_samples), dtype=np.float32)
+        idx = 0
         start_time = time.time()
-        executor = ThreadPoolExecutor(max_workers=1)
+
+        # Bounded handoff: drop live chunks instead of queueing unbounded work
+        chunk_queue = queue.Queue(maxsize=2)
+
+        def worker():
+            while (chunk := chunk_queue.get()) is not None:
+                asyncio.run_coroutine_threadsafe(process_chunk(chunk), loop).result()
 
         def callback(indata, frames, current_time, status):
-            nonlocal start_time
+            nonlocal start_time, idx
 
             if status:
                 print(f"Audio status: {status}")
 
-            if len(recording) >= max_chunks:
+            if idx >= max_chunks:
                 raise sd.CallbackStop
 
             # Validate input size
@@ -42,30 +62,35 @@ def record_and_transcribe():
                 print(f"\nWARNING: Expected {chunk_samples} samples, got {frames}")
                 return
 
-            # Pre-allocated copy
-            chunk = np.empty_like(indata, dtype="float32")
-            np.copyto(chunk, indata)
-            recording.append(chunk)
+            # Copy into the next row; rows are never reused, so the view is stable
+            chunk = ring[idx]
+            chunk[:] = indata[:, 0]
+            idx += 1
 
-            # Process immediately
-            executor.submit(process_chunk, chunk)
+            # Process immediately unless the worker is still behind
+            try:
+                chunk_queue.put_nowait(chunk)
+            except queue.Full:
+                print("\nSkipping partial transcription - worker is busy")
 
             # Visual feedback
             max_level = min(30, int(np.max(np.abs(indata)) * 50))
-            print("■" * max_level + " " * (30 - max_level), end="\r")
+            sys.stdout.write(BARS[max_level])
+            sys.stdout.flush()
 
-        def process_chunk(chunk):
+        async def process_chunk(chunk):
             if chunk.nbytes > max_mb * 1024 * 1024:
                 print(f"\nSkipping oversized chunk: {chunk.nbytes / 1024 / 1024:.1f}MB")
                 return
             try:
-                result = asyncio.run(
-                    transcribe_audio(audio_path=chunk, model_size="base")
-                )
+                result = await transcribe_audio(audio_path=chunk, model_size="base")
                 print(f"\nPartial: {result['text']}")
             except Exception as e:
                 print(f"\nTranscription error: {str(e)}")
 
+        worker_thread = threading.Thread(target=worker, daemon=True)
+        worker_thread.start()
+
         with sd.InputStream(
             samplerate=fs,
             channels=1,
@@ -75,29 +100,27 @@ def record_and_transcribe():
         ):
             input()
 
-        executor.shutdown(wait=True)
+        chunk_queue.put(None)
+        worker_thread.join()
 
-        if not recording:
+        if idx == 0:
             raise ValueError("No audio recorded - check microphone permissions")
 
-        audio = np.concatenate(recording)
+        audio = ring[:idx].reshape(-1)
         print(f"Recorded {len(audio) / fs:.2f} seconds of audio")
 
         if input("Save recording? (y/n): ").lower() == "y":
-            from scipy.io import wavfile
+            import soundfile as sf
 
             filename = f"recording_{int(time.time())}.wav"
-            wavfile.write(filename, fs, audio)
+            sf.write(filename, audio, fs, subtype="PCM_16")
             print(f"Saved to {filename}")
 
         if len(audio) > 0:
-            results = []
-            for i, chunk in enumerate(recording):
-                print(f"Chunk {i + 1}/{len(recording)} ({len(chunk) / fs:.2f}s)")
-                results.append(
-                    asyncio.run(transcribe_audio(audio_path=chunk, model_size="base"))
-                )
-            result = {"text": " ".join(r["text"] for r in results)}
+            # One pass over the whole recording rather than one call per chunk
+            result = asyncio.run_coroutine_threadsafe(
+                transcribe_audio(audio_path=audio, model_size="base"), loop
+            ).result()
         else:
             print("Warning: No audio recorded")
             result = {"text": ""}
@@ -111,6 +134,8 @@ def record_and_transcribe():
         print("1. Check System Preferences > Security & Privacy > Microphone")
         print("2. Ensure terminal has microphone access")
         print("3. Try different audio device if available")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
 
 
 if __name__ == "__main__":
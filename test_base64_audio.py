@@ -1,18 +1,19 @@
 import base64
 
 import numpy as np
+import soundfile as sf
 
-# Read first 10 seconds of audio
-with open("frontend/punainen_linnake.mp3", "rb") as f:
-    audio_bytes = f.read(16000 * 10)  # Approx 10 seconds
+# Decode the first 10 seconds to float32 PCM (MP3 bytes are not samples)
+with sf.SoundFile("frontend/punainen_linnake.mp3") as f:
+    audio = f.read(f.samplerate * 10, dtype="float32")
 
 # Convert to base64 and back
-audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+audio_base64 = base64.b64encode(audio.tobytes()).decode("utf-8")
 decoded_bytes = base64.b64decode(audio_base64)
 
 try:
     # Try converting to numpy array
-    audio_array = np.frombuffer(decoded_bytes, dtype=np.float32)
+    audio_array = np.frombuffer(decoded_bytes, dtype=np.float32).reshape(audio.shape)
     print(f"Success! Audio array shape: {audio_array.shape}")
 except Exception as e:
     print(f"Error converting audio: {str(e)}")
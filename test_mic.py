@@ -15,11 +15,13 @@ def test_microphone():
         recording = sd.rec(int(duration * fs), samplerate=fs, channels=1)
         sd.wait()  # Wait until recording is finished
 
+        peak = float(np.abs(recording).max())
+
         print("Recording complete. Check if audio was captured:")
         print(f"- Audio shape: {recording.shape}")
-        print(f"- Max amplitude: {np.max(np.abs(recording)):.4f}")
+        print(f"- Max amplitude: {peak:.4f}")
 
-        if np.max(np.abs(recording)) < 0.001:
+        if peak < 0.001:
             print("\nWARNING: Very quiet recording - check microphone")
 
     except Exception as e:
@@ -4,71 +4,133 @@ Bulletproof Real-time Transcriber
 Works with any version of MLX Whisper
 """
 
-import mlx_whisper
+import functools
+import inspect
+import os
+import queue
+
 import numpy as np
-import sounddevice as sd
+
+# mlx_whisper and sounddevice load native libraries (MLX, PortAudio), so they
+# are imported where they are used; importing this module stays cheap
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 3
+BLOCK_SIZE = 1600  # 100 ms per audio callback
+
+# One second of silence for the warm-up call; read-only so an accidental
+# in-place write by the backend fails loudly
+_SILENCE = np.zeros(SAMPLE_RATE, dtype=np.float32)
+_SILENCE.setflags(write=False)
+
+# Status lines are pre-encoded and written to stderr with one unbuffered
+# syscall; \x1b[2K clears whatever was on the line before
+CLEAR_LINE = "\r\x1b[2K"
+_STATUS_LOADING = f"{CLEAR_LINE}📦 Loading model...".encode()
+_STATUS_CLEAR = CLEAR_LINE.encode()
+_STATUS_RECORDING = f"{CLEAR_LINE}🔴 Recording...".encode()
+_STATUS_PROCESSING = f"{CLEAR_LINE}⚡ Processing...".encode()
+
+
+def _bind_transcribe():
+    """Specialize the transcribe call for the installed mlx_whisper API."""
+    import mlx_whisper
+
+    try:
+        sig = inspect.signature(mlx_whisper.transcribe)
+        use_path = "path_or_hf_repo" in sig.parameters
+    except (TypeError, ValueError):
+        use_path = True  # Not introspectable: assume the current keyword API
+
+    if use_path:
+        return functools.partial(
+            mlx_whisper.transcribe, path_or_hf_repo="tiny", fp16=False, language="en"
+        )
+    return lambda audio: mlx_whisper.transcribe(audio, "tiny")
 
 
 def transcribe():
+    import sounddevice as sd
+
     print("🎤 Real-time Transcription Started!")
     print("📍 Speak clearly, 3-second chunks")
     print("🛑 Press Ctrl+C to stop\n")
 
-    # First, let's see what mlx_whisper expects
-    try:
-        # Try to transcribe silence to see the API
-        test = mlx_whisper.transcribe(
-            np.zeros(16000, dtype=np.float32), path_or_hf_repo="tiny"
-        )
-        use_path = True
-    except:
-        try:
-            # Try without path_or_hf_repo
-            test = mlx_whisper.transcribe(np.zeros(16000, dtype=np.float32), "tiny")
-            use_path = False
-        except Exception as e:
-            print(f"Testing MLX Whisper API... {e}")
-            use_path = True
+    # Load the weights once up front; mlx_whisper keeps the model cached, so
+    # the first recorded window doesn't pay for the load
+    os.write(2, _STATUS_LOADING)
+    transcribe_fn = _bind_transcribe()
+    transcribe_fn(_SILENCE)
+    os.write(2, _STATUS_CLEAR)
 
     print("Ready! Start speaking...\n")
 
-    while True:
-        # Record 3 seconds of audio
-        print("🔴 Recording...", end="", flush=True)
-        audio = sd.rec(int(16000 * 3), samplerate=16000, channels=1, dtype="float32")
-        sd.wait()
-        print("\r⚡ Processing...", end="", flush=True)
+    # Preallocated windows cycle between the callback and the transcriber, so
+    # recording continues during inference without allocating per window
+    free = queue.Queue()
+    for _ in range(3):
+        free.put(np.empty(SAMPLE_RATE * WINDOW_SECONDS, dtype=np.float32))
+    windows = queue.Queue()
+    buf = free.get()
+    filled = 0
 
-        # Transcribe based on API version
-        try:
-            if use_path:
-                result = mlx_whisper.transcribe(
-                    audio[:, 0], path_or_hf_repo="tiny", fp16=False, language="en"
-                )
+    def callback(indata, frames, time_info, status):
+        nonlocal buf, filled
+        n = min(frames, len(buf) - filled)
+        buf[filled : filled + n] = indata[:n, 0]
+        filled += n
+        if filled == len(buf):
+            try:
+                next_buf = free.get_nowait()
+            except queue.Empty:
+                next_buf = buf  # Transcriber is behind: drop this window
             else:
-                result = mlx_whisper.transcribe(audio[:, 0], "tiny")
+                windows.put(buf)
+            buf = next_buf
+            filled = frames - n
+            buf[:filled] = indata[n:, 0]
 
-            # Extract text (handle dict or object)
-            if isinstance(result, dict):
-                text = result.get("text", "")
-            else:
-                text = str(result)
+    with sd.InputStream(
+        samplerate=SAMPLE_RATE,
+        channels=1,
+        dtype="float32",
+        blocksize=BLOCK_SIZE,
+        callback=callback,
+    ):
+        while True:
+            os.write(2, _STATUS_RECORDING)
+            audio = windows.get()
+            os.write(2, _STATUS_PROCESSING)
+            _transcribe_window(audio, transcribe_fn)
+            free.put(audio)
 
-            # Clear line and print result
-            print(f"\r{'  ' * 30}\r💬 {text.strip()}")
 
-        except Exception as e:
-            print(f"\r❌ Error: {e}")
-            print("Trying alternative approach...")
-            # Fallback: try the simplest possible call
-            try:
-                result = mlx_whisper.transcribe(audio[:, 0])
-                text = (
-                    result.get("text", "") if isinstance(result, dict) else str(result)
-                )
-                print(f"💬 {text.strip()}")
-            except Exception as e2:
-                print(f"Error: {e2}")
+def _transcribe_window(audio, transcribe_fn):
+    """Transcribe one recorded window and print the text."""
+    try:
+        result = transcribe_fn(audio)
+
+        # Extract text (handle dict or object)
+        if isinstance(result, dict):
+            text = result.get("text", "")
+        else:
+            text = str(result)
+
+        # Clear line and print result
+        print(f"{CLEAR_LINE}💬 {text.strip()}")
+
+    except Exception as e:
+        print(f"{CLEAR_LINE}❌ Error: {e}")
+        print("Trying alternative approach...")
+        # Fallback: try the simplest possible call
+        try:
+            import mlx_whisper
+
+            result = mlx_whisper.transcribe(audio)
+            text = result.get("text", "") if isinstance(result, dict) else str(result)
+            print(f"💬 {text.strip()}")
+        except Exception as e2:
+            print(f"Error: {e2}")
 
 
 # Auto-run
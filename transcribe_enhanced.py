@@ -3,21 +3,34 @@
 Low-latency, real-time transcriber using a streaming architecture with improved efficiency.
 """
 
+import copy
+import fnmatch
 import json
+import math
+import os
+import queue
 import threading
 import time
-from collections import deque
 from pathlib import Path
 from typing import Literal, Optional
 
 import numpy as np
-import numpy.typing as npt
 import sounddevice as sd
 import torch
 from colorama import Fore, Style, init
 
 import whisper
 
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -58,6 +71,9 @@ MODELS = [
 ]
 
 
+DEVICE_NAMES = {"cuda": "NVIDIA GPU", "mps": "Apple Silicon", "cpu": "CPU"}
+
+
 # Determine available device type
 def get_device_type() -> Literal["cuda", "mps", "cpu"]:
     if torch.cuda.is_available():
@@ -67,6 +83,27 @@ def get_device_type() -> Literal["cuda", "mps", "cpu"]:
     return "cpu"
 
 
+# Directory listings keyed by path, reused while the directory mtime is unchanged
+_cache_listings: dict[str, tuple[int, list[str]]] = {}
+
+
+def _list_cache_dir(cache_dir: str) -> list[str]:
+    """Returns the entry names in a model cache directory, rescanning only on change."""
+    try:
+        mtime = os.stat(cache_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    cached = _cache_listings.get(cache_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(cache_dir) as entries:
+        names = [entry.name for entry in entries]
+    _cache_listings[cache_dir] = (mtime, names)
+    return names
+
+
 class RealTimeTranscriber:
     """
     A real-time audio transcriber using a producer-consumer pattern.
@@ -84,28 +121,64 @@ class RealTimeTranscriber:
         self.model_name = model_name or config.get("defaults", {}).get("model", "base")
         self.device = device
         self.sample_rate = config.get("defaults", {}).get("sample_rate", 16000)
-        self.model: Optional[whisper.Whisper] = None
-        self.audio_queue: deque[npt.NDArray[np.float32]] = deque()
+        # "whisper" (PyTorch reference) or "faster-whisper" (CTranslate2, int8)
+        self.backend = config.get("defaults", {}).get("backend", "whisper")
+        self.model = None  # whisper.Whisper, or faster_whisper.WhisperModel
+        # Language code such as "en"; None detects it for every chunk
+        self.language = config.get("defaults", {}).get("language")
         self.is_running = False
         # Set a threshold (in seconds) for the minimum amount of audio to transcribe.
         self.chunk_duration_sec = config.get("defaults", {}).get(
             "chunk_duration_sec", 1.0
         )
+        self.overlap_samples = int(0.2 * self.sample_rate)  # 200ms overlap
+
+        # The callback copies each block into a preallocated slot and bumps
+        # _tail; the worker consumes from _head. Each counter has one writer,
+        # so no lock is needed. 512 slots of 1024 samples hold ~30s.
+        self.block_size = 1024
+        self._slots = np.empty((512, self.block_size), dtype=np.float32)
+        self._slot_frames = [0] * len(self._slots)
+        self._head = 0
+        self._tail = 0
+        self._data_ready = threading.Event()
+
+        # The worker gathers slots into this buffer and transcribes a slice of
+        # it instead of concatenating queued blocks. Whisper looks at 30s at
+        # most, so blocks past that stay in their slots for the next pass.
+        self._ring = np.empty(30 * self.sample_rate, dtype=np.float32)
+        self._write = 0
+        self._overlap = 0  # Leading ring samples carried over from the last pass
+        # Console output is handed to a printer thread: (time, text) for
+        # transcripts, (None, line) for debug lines, None to stop
+        self._print_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # CUDA only: pinned host staging buffer and the device tensor it feeds
+        self._pinned_audio: Optional[torch.Tensor] = None
+        self._dev_audio: Optional[torch.Tensor] = None
         # A simple silence threshold for VAD; experiment with this value.
         self.silence_threshold = 0.01
+        # WebRTC VAD when available (30ms frames); else the energy threshold above
+        self._vad = None
+        if webrtcvad is not None and self.sample_rate in (8000, 16000, 32000, 48000):
+            self._vad = webrtcvad.Vad(2)
+            self._vad_frame_bytes = self.sample_rate * 30 // 1000 * 2
         self.device_type = get_device_type()
-        self.cache_dir = self.get_model_cache_dirs()[0]
-
-        # Performance tracking
-        self.stats = {
-            "total_chunks": 0,
-            "total_audio_sec": 0.0,
-            "total_processing_sec": 0.0,
-            "last_latency": 0.0,
-        }
+        # Resolved once; config paths don't change while the transcriber runs
+        self._cache_dirs = self._find_model_cache_dirs()
+        self.cache_dir = self._cache_dirs[0]
+
+        # Performance tracking: audio and processing seconds per transcribed
+        # chunk, overwritten round-robin so reads never allocate per chunk
+        self._stats = np.zeros(1024, dtype=[("audio_sec", "f4"), ("proc_sec", "f4")])
+        self._stats_count = 0
 
     def get_model_cache_dirs(self):
         """Returns all configured cache directories that exist with valid models."""
+        return self._cache_dirs
+
+    @staticmethod
+    def _find_model_cache_dirs() -> list[str]:
+        """Expands the configured cache paths and keeps the ones that exist."""
         valid_dirs = []
         for path in config.get("paths", {}).get("model_cache_paths", []):
             expanded_path = Path(path).expanduser()
@@ -113,23 +186,23 @@ class RealTimeTranscriber:
                 valid_dirs.append(str(expanded_path))
         return valid_dirs or [str(Path.home() / ".cache" / "whisper")]
 
-    def _is_model_cached(self, model_name: str) -> bool:
-        """Check if model exists in cache with support for custom models."""
+    def cached_model_names(self) -> set[str]:
+        """Returns the names of all models in the cache dirs, custom ones included."""
+        names = set()
         for cache_dir in self.get_model_cache_dirs():
-            # Standard .pt files
-            if (Path(cache_dir) / f"{model_name}.pt").exists():
-                return True
-
-            # Hugging Face format (both OpenAI and custom)
-            hf_patterns = [
-                f"models--openai--whisper-{model_name.split('-')[0]}/snapshots/*",
-                f"models--*--whisper-*/snapshots/*",  # Custom models
-            ]
+            for name in _list_cache_dir(cache_dir):
+                # Standard .pt files
+                if name.endswith(".pt"):
+                    names.add(name[:-3])
+                # Hugging Face format (both OpenAI and custom), once downloaded
+                elif fnmatch.fnmatch(name, "models--*--whisper-*"):
+                    if _list_cache_dir(os.path.join(cache_dir, name, "snapshots")):
+                        names.add(name.split("--")[-1].replace("whisper-", ""))
+        return names
 
-            for pattern in hf_patterns:
-                if list(Path(cache_dir).glob(pattern)):
-                    return True
-        return False
+    def _is_model_cached(self, model_name: str) -> bool:
+        """Check if model exists in cache with support for custom models."""
+        return model_name in self.cached_model_names()
 
     def load_model(self) -> bool:
         if self.model is None:
@@ -144,25 +217,103 @@ class RealTimeTranscriber:
             else:
                 print(f"{Fore.GREEN}✅ Model found in cache{Style.RESET_ALL}")
 
+            if self.backend == "faster-whisper" and WhisperModel is None:
+                print(
+                    f"{Fore.YELLOW}⚠️ faster-whisper not installed - using whisper{Style.RESET_ALL}"
+                )
+                self.backend = "whisper"
+
             use_fp16 = self.device_type in ("cuda", "mps")
-            device_name = {"cuda": "NVIDIA GPU", "mps": "Apple Silicon", "cpu": "CPU"}[
-                self.device_type
-            ]
-            print(
-                f"{Fore.GREEN}⚡ Using {device_name} ({'fp16' if use_fp16 else 'fp32'}){Style.RESET_ALL}"
-            )
+            device_name = DEVICE_NAMES[self.device_type]
+            if self.backend == "faster-whisper":
+                # CTranslate2 has no MPS backend; int8 weights run on the CPU there
+                ct2_device = "cuda" if self.device_type == "cuda" else "cpu"
+                compute_type = "int8_float16" if ct2_device == "cuda" else "int8"
+                precision = compute_type
+            else:
+                precision = "fp16" if use_fp16 else "int8 linear, fp32"
+            print(f"{Fore.GREEN}⚡ Using {device_name} ({precision}){Style.RESET_ALL}")
 
             try:
                 # Load model
-                self.model = whisper.load_model(
-                    self.model_name,
-                    device=self.device_type,
-                    download_root=self.cache_dir,
-                )
+                warmup_passes = 1
+                if self.backend == "faster-whisper":
+                    self.model = WhisperModel(
+                        self.model_name,
+                        device=ct2_device,
+                        compute_type=compute_type,
+                        download_root=self.cache_dir,
+                    )
+                    self._transcribe = self._transcribe_faster_whisper
+                else:
+                    self.model = whisper.load_model(
+                        self.model_name,
+                        device=self.device_type,
+                        download_root=self.cache_dir,
+                    )
+                    self._transcribe = self._transcribe_whisper
+                    # Greedy, timestamp-free decoding of a single 30s window;
+                    # real-time chunks never need transcribe()'s seek loop.
+                    # A known language skips the lang-id pass; English-only
+                    # models have no language tokens, so decode() must not try it.
+                    self._decode_options = whisper.DecodingOptions(
+                        fp16=use_fp16,
+                        without_timestamps=True,
+                        language=self.language if self.model.is_multilingual else "en",
+                        task="transcribe",
+                    )
 
-                # Warm up with empty audio
+                    if self.device_type == "cuda":
+                        self._pinned_audio = torch.empty(len(self._ring)).pin_memory()
+                        self._dev_audio = torch.empty(len(self._ring), device="cuda")
+
+                    # Whisper pads every segment to 30s, so the encoder always sees
+                    # the same input shape and one captured graph serves every chunk.
+                    # The decoder's token sequence grows per step, so it stays eager.
+                    if self.device_type == "cuda" and hasattr(torch, "compile"):
+                        eager_encoder = self.model.encoder
+                        try:
+                            self.model.encoder = torch.compile(
+                                eager_encoder, mode="reduce-overhead"
+                            )
+                            # Compilation errors (no Triton, unsupported
+                            # platform) only surface on the first call
+                            self._transcribe(np.zeros((16000,), dtype=np.float32))
+                        except Exception as e:
+                            self.model.encoder = eager_encoder
+                            print(
+                                f"{Fore.YELLOW}⚠️ torch.compile failed, using the eager encoder: {e}{Style.RESET_ALL}"
+                            )
+
+                    if self.device_type == "cpu":
+                        # int8 weights cut the memory traffic of the fp32 matmuls
+                        # that dominate on CPU to a quarter. Whisper's Linear
+                        # subclass only adds a dtype cast (a no-op in fp32), but
+                        # quantize_dynamic swaps exact nn.Linear types only.
+                        # Work on a copy so a failure leaves the fp32 model usable
+                        fp32_model = self.model
+                        try:
+                            int8_model = copy.deepcopy(fp32_model)
+                            for module in int8_model.modules():
+                                if isinstance(module, torch.nn.Linear):
+                                    module.__class__ = torch.nn.Linear
+                            torch.ao.quantization.quantize_dynamic(
+                                int8_model, {torch.nn.Linear}, torch.qint8, inplace=True
+                            )
+                            self.model = int8_model
+                            # Builds without a quantized engine fail on first use
+                            self._transcribe(np.zeros((16000,), dtype=np.float32))
+                        except Exception as e:
+                            self.model = fp32_model
+                            print(
+                                f"{Fore.YELLOW}⚠️ int8 quantization failed, using fp32: {e}{Style.RESET_ALL}"
+                            )
+
+                # Warm up with empty audio; a compiled encoder was already run
+                # once above, so this pass records its CUDA graph
                 warmup_audio = np.zeros((16000,), dtype=np.float32)  # 1s of silence
-                _ = self.model.transcribe(warmup_audio, fp16=use_fp16)
+                for _ in range(warmup_passes):
+                    self._transcribe(warmup_audio)
 
                 print(f"{Fore.GREEN}✅ Model loaded and warmed up!{Style.RESET_ALL}")
                 return True
@@ -172,77 +323,171 @@ class RealTimeTranscriber:
                 return False
         return True
 
+    @torch.inference_mode()
+    def _transcribe_whisper(self, audio: np.ndarray) -> str:
+        """Transcribes with the PyTorch reference implementation."""
+        if self._dev_audio is not None:
+            # Upload through pinned memory into a persistent device tensor; the
+            # mel spectrogram is then computed on the GPU next to the model
+            n = len(audio)
+            staged = self._pinned_audio[:n].copy_(torch.from_numpy(audio))
+            audio = self._dev_audio[:n].copy_(staged, non_blocking=True)
+        # Same mel as transcribe() computes for its first window, without its
+        # segment loop and temperature fallback around decode()
+        mel = whisper.log_mel_spectrogram(
+            audio, self.model.dims.n_mels, padding=whisper.audio.N_SAMPLES
+        )
+        mel = mel[:, : whisper.audio.N_FRAMES].to(self.model.device)
+        result = whisper.decode(self.model, mel, self._decode_options)
+        # transcribe()'s default no-speech rule: drop likely hallucinations
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return ""
+        return result.text
+
+    def _transcribe_faster_whisper(self, audio: np.ndarray) -> str:
+        """Transcribes with CTranslate2; greedy decoding keeps chunk latency low."""
+        segments, _ = self.model.transcribe(
+            audio,
+            beam_size=1,
+            language=self.language,
+            vad_filter=False,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+        )
+        return "".join(segment.text for segment in segments)
+
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info, status
     ) -> None:
-        """Called by the sounddevice stream for each audio block. Quickly copy and enqueue the data."""
+        """Called by the sounddevice stream for each audio block. Quickly copy it into a slot."""
         if status:
             print(status, flush=True)
-        # Avoid in-place modifications
-        self.audio_queue.append(indata.copy())
+        tail = self._tail
+        if tail - self._head == len(self._slots):
+            return  # Worker is a full ring behind; drop the block
+        idx = tail % len(self._slots)
+        np.copyto(self._slots[idx, :frames], indata[:, 0])
+        self._slot_frames[idx] = frames
+        self._tail = tail + 1
+        self._data_ready.set()
 
     def _is_speech(self, audio: np.ndarray) -> bool:
-        """Improved voice activity detection using energy thresholding."""
-        # Calculate RMS energy
-        energy = np.sqrt(np.mean(audio**2))
+        """Voice activity detection with WebRTC VAD, or energy thresholding."""
+        if self._vad is not None:
+            # Convert to 16-bit PCM for VAD; clip first, as float input can
+            # overshoot ±1.0 and the cast would wrap around on loud speech
+            pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+            step = self._vad_frame_bytes
+            # Require two voiced 30ms frames so one click can't submit a buffer
+            voiced = 0
+            for i in range(0, len(pcm) - step + 1, step):
+                if self._vad.is_speech(pcm[i : i + step], self.sample_rate):
+                    voiced += 1
+                    if voiced >= 2:
+                        return True
+            return False
+
+        # Calculate RMS energy; dot() sums the squares without a temporary array
+        energy = math.sqrt(float(np.dot(audio, audio)) / len(audio))
         # Dynamic threshold based on background noise level
-        return energy > max(self.silence_threshold, 0.02 * np.abs(audio).max())
+        peak = max(float(audio.max()), -float(audio.min()))
+        return energy > max(self.silence_threshold, 0.02 * peak)
 
     def _transcription_worker(self) -> None:
         """Processes audio chunks with dynamic buffering and overlap."""
-        chunks = []
-        overlap_samples = int(0.2 * self.sample_rate)  # 200ms overlap
+        # Minimum buffer worth a decoder run, and the length that forces one
+        min_samples = self.sample_rate * self.chunk_duration_sec
+        max_samples = 1.5 * min_samples
 
         while self.is_running:
-            try:
-                start_time = time.time()
-                audio_chunk = self.audio_queue.popleft()
-                chunks.append(audio_chunk.flatten())
-
-                # Process if speech detected or buffer too large
-                audio_buffer = np.concatenate(chunks)
-                if (
-                    self._is_speech(audio_buffer)
-                    or len(audio_buffer)
-                    >= 1.5 * self.sample_rate * self.chunk_duration_sec
-                ):
-
-                    # Keep last 200ms for overlap
-                    if len(chunks) > 1:
-                        chunks = [chunks[-1][-overlap_samples:]]
-                    else:
-                        chunks = []
-
-                    process_start = time.time()
-                    result = self.model.transcribe(
-                        audio_buffer, fp16=(self.device_type in ("cuda", "mps"))
+            if not self._data_ready.wait(0.1):
+                continue
+            # Clear before draining so a block published meanwhile re-arms it
+            self._data_ready.clear()
+
+            # Drain everything queued so a backlog becomes one transcribe call
+            tail = self._tail
+            while self._head < tail:
+                idx = self._head % len(self._slots)
+                start = self._write
+                frames = self._slot_frames[idx]
+                if start + frames > len(self._ring):
+                    self._data_ready.set()  # Window full; resume after this pass
+                    break
+                self._ring[start : start + frames] = self._slots[idx, :frames]
+                self._write = start + frames
+                self._head += 1
+
+            n = self._write
+            if n < min_samples:
+                continue  # Too short to be worth a decoder run yet
+            audio_buffer = self._ring[:n]
+
+            # Process if speech detected or buffer too large. The carried-over
+            # overlap was already heard; a voiced tail would otherwise pass
+            # the gate for the silent buffer that follows every utterance.
+            speech = self._is_speech(self._ring[self._overlap : n])
+            if not speech:
+                if n < max_samples:
+                    continue
+                if self._vad is not None:
+                    # The VAD heard no speech in a full buffer; skip the decoder
+                    self._keep_overlap(n)
+                    continue
+
+            process_start = time.time()
+            text = self._transcribe(audio_buffer)
+
+            self._keep_overlap(n)
+
+            # Update stats
+            audio_sec = n / self.sample_rate
+            process_sec = time.time() - process_start
+            self._stats[self._stats_count % len(self._stats)] = (audio_sec, process_sec)
+            self._stats_count += 1
+
+            if DEBUG_MODE:
+                self._print_queue.put(
+                    (
+                        None,
+                        f"\n{Fore.BLUE}📊 Chunk: {audio_sec:.2f}s | "
+                        f"Process: {process_sec:.2f}s | "
+                        f"RTF: {process_sec/audio_sec:.2f}{Style.RESET_ALL}",
                     )
+                )
 
-                    # Update stats
-                    audio_sec = len(audio_buffer) / self.sample_rate
-                    process_sec = time.time() - process_start
-                    self.stats["total_chunks"] += 1
-                    self.stats["total_audio_sec"] += audio_sec
-                    self.stats["total_processing_sec"] += process_sec
-                    self.stats["last_latency"] = process_sec
-
-                    if DEBUG_MODE:
-                        print(
-                            f"\n{Fore.BLUE}📊 Chunk: {audio_sec:.2f}s | "
-                            f"Process: {process_sec:.2f}s | "
-                            f"RTF: {process_sec/audio_sec:.2f}{Style.RESET_ALL}"
-                        )
-
-                    text = result["text"].strip()
-                    if text:
-                        print(
-                            f"\r{Fore.GREEN}{time.strftime('%H:%M:%S')}: {text}{Style.RESET_ALL}",
-                            end="",
-                            flush=True,
-                        )
-
-            except IndexError:
-                time.sleep(0.01)
+            text = text.strip()
+            if text:
+                self._print_queue.put((time.time(), text))
+
+    def _printer(self) -> None:
+        """Prints queued output so terminal writes stay off the worker thread."""
+        last_second, stamp = None, ""
+        while (item := self._print_queue.get()) is not None:
+            when, text = item
+            if when is None:
+                print(text)
+                continue
+            # Format the clock once per second, not once per chunk
+            if int(when) != last_second:
+                last_second = int(when)
+                stamp = time.strftime("%H:%M:%S", time.localtime(when))
+            print(f"\r{Fore.GREEN}{stamp}: {text}{Style.RESET_ALL}", end="", flush=True)
+
+    def rolling_rtf(self, window: int = 60) -> float:
+        """Returns processing over audio seconds for the last `window` chunks."""
+        count = min(window, self._stats_count, len(self._stats))
+        if not count:
+            return 0.0
+        end = self._stats_count % len(self._stats)
+        recent = self._stats[np.arange(end - count, end)]  # Negative indices wrap
+        return float(recent["proc_sec"].sum() / recent["audio_sec"].sum())
+
+    def _keep_overlap(self, n: int) -> None:
+        """Keeps the last 200ms of the first n buffered samples for overlap."""
+        keep = min(self.overlap_samples, n)
+        self._ring[:keep] = self._ring[n - keep : n]
+        self._write = self._overlap = keep
 
     def stop(self) -> None:
         """Stops the transcription gracefully."""
@@ -268,6 +513,11 @@ class RealTimeTranscriber:
                         f"{Fore.RED}⚠️  Worker thread did not stop gracefully{Style.RESET_ALL}"
                     )
 
+            # Flush pending output, then let the printer exit
+            if hasattr(self, "printer_thread") and self.printer_thread:
+                self._print_queue.put(None)
+                self.printer_thread.join(timeout=2.0)
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -291,6 +541,7 @@ class RealTimeTranscriber:
                 samplerate=self.sample_rate,
                 channels=1,
                 dtype="float32",
+                blocksize=self.block_size,
                 device=self.device,
                 callback=self._audio_callback,
             ) as self.stream:
@@ -299,6 +550,10 @@ class RealTimeTranscriber:
                     target=self._transcription_worker, daemon=True
                 )
                 self.worker_thread.start()
+                self.printer_thread = threading.Thread(
+                    target=self._printer, daemon=True
+                )
+                self.printer_thread.start()
 
                 try:
                     while self.is_running:
@@ -326,35 +581,47 @@ def scan_and_update_models() -> None:
     """Scans for both standard and custom models."""
     transcriber = RealTimeTranscriber()
 
+    # Skip the scan when no cache directory changed since the last one. A
+    # download finishing inside an existing models--* entry only touches its
+    # snapshots dir, so those count too.
+    dir_mtimes = {}
+    for cache_dir in transcriber.get_model_cache_dirs():
+        if not os.path.isdir(cache_dir):
+            continue
+        dir_mtimes[cache_dir] = os.stat(cache_dir).st_mtime_ns
+        for name in fnmatch.filter(_list_cache_dir(cache_dir), "models--*--whisper-*"):
+            snapshots = os.path.join(cache_dir, name, "snapshots")
+            if os.path.isdir(snapshots):
+                dir_mtimes[snapshots] = os.stat(snapshots).st_mtime_ns
+    if config.get("cached_models", {}).get("dir_mtimes") == dir_mtimes:
+        return
+
     # Standard models + any found custom ones
     all_models = MODELS.copy()
 
     # Find custom models in Hugging Face cache
     for cache_dir in transcriber.get_model_cache_dirs():
-        for model_dir in Path(cache_dir).glob("models--*--whisper-*"):
-            model_name = model_dir.name.split("--")[-1].replace("whisper-", "")
+        for name in fnmatch.filter(_list_cache_dir(cache_dir), "models--*--whisper-*"):
+            model_name = name.split("--")[-1].replace("whisper-", "")
             if model_name not in all_models:
                 all_models.append(model_name)
 
     # Get current cached models from config
     current_models = set(config.get("cached_models", {}).get("available", []))
-    verified_models = set()
-
-    # Verify existing models still exist
-    for model in current_models:
-        if model in all_models and transcriber._is_model_cached(model):
-            verified_models.add(model)
 
-    # Scan for new models
-    for model in all_models:
-        if model not in verified_models and transcriber._is_model_cached(model):
-            verified_models.add(model)
+    # One listing per cache dir covers every candidate, old and new
+    cached = transcriber.cached_model_names()
+    verified_models = {model for model in all_models if model in cached}
 
-    # Update config if changed
-    if verified_models != current_models:
+    # Update config; the stored mtimes let the next run skip an unchanged scan
+    if (
+        verified_models != current_models
+        or config.get("cached_models", {}).get("dir_mtimes") != dir_mtimes
+    ):
         config["cached_models"] = {
             "last_scan": time.strftime("%Y-%m-%d %H:%M:%S"),
             "available": sorted(verified_models),
+            "dir_mtimes": dir_mtimes,
         }
         try:
             with open(CONFIG_PATH, "w") as f:
@@ -1,35 +1,66 @@
 """Fixed Real-time macOS transcription with MLX Whisper"""
 
+import functools
 import os
+import queue
 import sys
 import threading
 import time
 import warnings
-from collections import deque
 from typing import Any, Union
 
 import numpy as np
 import sounddevice as sd
 
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 warnings.filterwarnings("ignore")
 
 DEBUG = True
 
+# Audio is captured as int16 and scaled to [-1, 1) float32 on the way into
+# the ring buffer
+INT16_SCALE = np.float32(1 / 32768.0)
+
+# Level meter lines for 0..30 filled bars
+METER_BARS = [f"\r🎤 {'█' * i}{'░' * (30 - i)} " for i in range(31)]
+
 
 def debug_print(msg: str):
     if DEBUG:
         print(f"[DEBUG] {msg}")
 
 
+@functools.lru_cache(maxsize=1)
+def _default_input():
+    """Default input device index and device list, enumerated once per process."""
+    return sd.default.device[0], sd.query_devices()
+
+
+def _absmax(audio: np.ndarray) -> float:
+    """Peak absolute amplitude, without allocating an abs() temporary."""
+    return max(float(audio.max()), -float(audio.min()))
+
+
+# Text getters by exact result type; anything else is read through .text
+_TEXT_GETTERS = {
+    dict: lambda result: result.get("text", ""),
+    str: lambda result: result,
+}
+
+
+def _text_attribute(result: Any) -> str:
+    # Never str() an unknown result: it may be a large dataclass
+    return getattr(result, "text", None) or ""
+
+
 def extract_text(result: Union[dict, str, Any]) -> str:
     """Extract transcribed text from different result types."""
-    if isinstance(result, dict):
-        return result.get("text", "").strip()
-    if isinstance(result, str):
-        return result.strip()
-    if hasattr(result, "text"):
-        return str(result.text).strip()
-    return str(result).strip()
+    text = _TEXT_GETTERS.get(type(result), _text_attribute)(result)
+    return str(text).strip()
 
 
 def print_transcription(text: str, debug: bool):
@@ -50,19 +81,28 @@ class MacWhisperTranscriber:
     def __init__(self, model_size: str = "tiny", debug: bool = True):
         self.debug = debug
         self.sample_rate = 16000
-        self.buffer_duration = 2.0  # 2 second buffer
+        self.buffer_duration = 30.0  # Whisper's native window
+        self.min_new_audio = 0.5  # seconds of new audio before re-transcribing
+        self.stable_margin = 1.0  # segments ending this close to "now" may change
         self.buffer_size = int(self.sample_rate * self.buffer_duration)
         self.process_interval = 0.3  # process every 300ms
         self.model_size = model_size
         self.channels = 1
         self.blocksize = 512  # Increase for stability
+        self.model = None
 
         print(f"\n🔄 Loading MLX Whisper {model_size} model...")
 
         # Import and detect the correct API
         try:
+            import mlx.core as mx
             import mlx_whisper
 
+            # Resolved once for run()'s cleanup; older MLX keeps it under metal
+            self._clear_cache = getattr(
+                getattr(mx, "metal", None), "clear_cache", None
+            ) or getattr(mx, "clear_cache", lambda: None)
+
             # Check what's available in mlx_whisper
             debug_print(f"MLX Whisper attributes: {dir(mlx_whisper)}")
 
@@ -73,8 +113,11 @@ class MacWhisperTranscriber:
             if hasattr(mlx_whisper, "transcribe"):
                 # Use local model files
                 if os.path.exists(model_path) and os.path.exists(config_path):
-                    self.transcribe_fn = lambda audio: mlx_whisper.transcribe(
-                        audio, model_path=model_path, config_path=config_path
+                    # Bound once: no lambda frame or module lookup per call
+                    self.transcribe_fn = functools.partial(
+                        mlx_whisper.transcribe,
+                        model_path=model_path,
+                        config_path=config_path,
                     )
                 else:
                     raise FileNotFoundError(
@@ -84,14 +127,14 @@ class MacWhisperTranscriber:
             elif hasattr(mlx_whisper, "load"):
                 # Alternative API
                 self.model = mlx_whisper.load(model_size)
-                self.transcribe_fn = lambda audio: self.model.transcribe(audio)
+                self.transcribe_fn = self.model.transcribe
 
             elif hasattr(mlx_whisper, "whisper"):
                 # Try to find whisper submodule
                 whisper_module = mlx_whisper.whisper
                 if hasattr(whisper_module, "load_model"):
                     self.model = whisper_module.load_model(model_size)
-                    self.transcribe_fn = lambda audio: self.model.transcribe(audio)
+                    self.transcribe_fn = self.model.transcribe
                 else:
                     raise ImportError(
                         "Cannot find proper load function in mlx_whisper.whisper"
@@ -99,11 +142,21 @@ class MacWhisperTranscriber:
             else:
                 raise ImportError("Cannot find proper API in mlx_whisper module")
 
+            if self.model is not None:
+                mx.eval(self.model.parameters())  # Upload weights now, not on first use
+
             print("✅ Model loaded successfully!")
 
-            # Test the transcription
-            test_audio = np.zeros(self.sample_rate, dtype=np.float32)
-            test_result = self.transcribe_fn(test_audio)
+            # Warm up on a full 30 s two-tone signal so every kernel on the
+            # decode path gets compiled. The second pass fills the pipeline
+            # cache, so the first live chunk already runs at steady state.
+            t = np.arange(self.sample_rate * 30) / self.sample_rate
+            warm = (
+                0.1 * np.sin(2 * np.pi * 440 * t) + 0.1 * np.sin(2 * np.pi * 880 * t)
+            ).astype(np.float32)
+            for _ in range(2):
+                test_result = self.transcribe_fn(warm)
+                mx.eval(test_result)
             debug_print(f"Model test passed: {type(test_result)}")
 
         except Exception as e:
@@ -129,55 +182,93 @@ class MacWhisperTranscriber:
             sys.exit(1)
 
         self.running = False
-        self.audio_buffer = deque(maxlen=self.buffer_size)
+        # Circular buffer of the last buffer_size samples; _write_idx is the
+        # oldest sample once the buffer has wrapped
+        self.audio_buffer = np.zeros(self.buffer_size, dtype=np.float32)
+        self._write_idx = 0
+        self._filled = 0
+        self._last_submit = 0  # frames_processed at the last transcription
+        # frames_processed up to which text has been printed; audio before it
+        # is never sent to the model again
+        self._committed = 0
         self.process_lock = threading.Lock()
-        self.last_processed_time = 0
+        # One pending tick at most; a single worker keeps transcriptions
+        # serialized on the Metal queue
+        self._work = queue.Queue(maxsize=1)
+        # Blocks from the audio callback; everything but the copy happens on
+        # the ingest thread so the callback meets its deadline
+        self._raw_q = queue.SimpleQueue()
+        # Ticks are scheduled by recorded frames, not wall-clock time
+        self._tick_frames = int(self.process_interval * self.sample_rate)
+        self._frames_since_tick = 0
         self.audio_level = 0
+        self._want_level = not debug  # Only the non-debug meter reads the level
         self.frames_processed = 0
         self.transcription_count = 0
         self.error_count = 0
         self.last_error = None
         self.last_text = ""
+        # Speech gate in front of the model; without webrtcvad only the
+        # near-silence check applies
+        self.vad = webrtcvad.Vad(2) if webrtcvad is not None else None
+        self.vad_frame = self.sample_rate * 30 // 1000  # 30ms frames
 
     def audio_callback(self, indata, frames, time_info, status):
-        """Audio input callback function."""
+        """Audio input callback; hands a copy of the block to the ingest thread."""
+        if status:
+            debug_print(f"Audio callback status: {status}")
+        # indata is PortAudio's reused buffer, so copy it out as bytes
+        self._raw_q.put(bytes(indata))
+
+    def _ingest_loop(self):
+        """Feeds recorded blocks to _ingest until a None arrives."""
+        while (indata := self._raw_q.get()) is not None:
+            self._ingest(indata)
+
+    def _ingest(self, indata):
+        """Adds a block to the buffer, updates the meter and schedules ticks."""
         try:
-            if status:
-                debug_print(f"Audio callback status: {status}")
-
             if indata is None or len(indata) == 0:
                 debug_print("Empty audio data received")
                 return
 
-            # Extract mono audio
-            audio_data = (
-                indata[:, 0].astype(np.float32)
-                if indata.ndim > 1
-                else indata.astype(np.float32)
-            )
-            self.audio_level = float(np.max(np.abs(audio_data)))
+            # Extract mono audio as a view of the interleaved int16 block
+            audio_data = np.frombuffer(indata, dtype=np.int16)[:: self.channels]
+            if self._want_level:
+                self.audio_level = _absmax(audio_data) * INT16_SCALE
 
-            # Add to buffer
+            # Add to buffer, wrapping at the end; multiply() converts and
+            # copies in one pass
             with self.process_lock:
-                self.audio_buffer.extend(audio_data)
+                tail = audio_data[-self.buffer_size :]
+                n = len(tail)
+                start = self._write_idx
+                split = min(n, self.buffer_size - start)
+                np.multiply(
+                    tail[:split],
+                    INT16_SCALE,
+                    out=self.audio_buffer[start : start + split],
+                )
+                np.multiply(
+                    tail[split:], INT16_SCALE, out=self.audio_buffer[: n - split]
+                )
+                self._write_idx = (start + n) % self.buffer_size
+                self._filled = min(self._filled + n, self.buffer_size)
                 self.frames_processed += len(audio_data)
 
-            # Visual feedback
-            if not self.debug:
-                bars = int(self.audio_level * 30)
-                print(f"\r🎤 {'█' * bars}{'░' * (30 - bars)} ", end="", flush=True)
-
             # Check if it's time to process
-            current_time = time.time()
-            if (current_time - self.last_processed_time) >= self.process_interval:
-                self.last_processed_time = current_time
-                thread = threading.Thread(target=self.process_audio, daemon=True)
-                thread.start()
+            self._frames_since_tick += len(audio_data)
+            if self._frames_since_tick >= self._tick_frames:
+                self._frames_since_tick = 0
+                try:
+                    self._work.put_nowait(True)
+                except queue.Full:
+                    pass  # A tick is already pending; it will see this audio
 
         except Exception as e:
             self.error_count += 1
             self.last_error = str(e)
-            debug_print(f"Audio callback error: {e}")
+            debug_print(f"Audio ingest error: {e}")
 
     def process_audio(self):
         """Processes audio buffer for transcription."""
@@ -186,34 +277,66 @@ class MacWhisperTranscriber:
 
         try:
             with self.process_lock:
-                buffer_len = len(self.audio_buffer)
+                buffer_len = self._filled
                 if buffer_len < self.sample_rate * 0.5:  # Need at least 0.5s
                     debug_print(f"Buffer too small: {buffer_len} samples")
                     return
+                if (
+                    self.frames_processed - self._last_submit
+                    < self.sample_rate * self.min_new_audio
+                ):
+                    return  # Too little new audio to change the transcript
+                self._last_submit = end = self.frames_processed
+
+                # Snapshot the uncommitted audio, oldest-first, as one array
+                start = max(self._committed, end - buffer_len)
+                n = end - start
+                w = self._write_idx
+                if n <= w:
+                    audio_data = self.audio_buffer[w - n : w].copy()
+                else:
+                    audio_data = np.concatenate(
+                        (self.audio_buffer[w - n :], self.audio_buffer[:w])
+                    )
 
-                # Convert deque to numpy array
-                audio_data = np.array(list(self.audio_buffer), dtype=np.float32)
-
-            # Check for silence
-            if np.max(np.abs(audio_data)) < 0.001:
+            # Nothing to say in silence, so commit it without the model
+            if _absmax(audio_data) < 0.001:
                 debug_print("Silent audio, skipping")
+                self._committed = end
+                return
+            if self.vad is not None and not self._has_speech(audio_data):
+                debug_print("No speech detected, skipping")
+                self._committed = end
                 return
-
-            # Normalize if needed
-            max_val = np.max(np.abs(audio_data))
-            if max_val > 1.0:
-                audio_data = audio_data / max_val
-                debug_print(f"Normalized audio from max {max_val}")
 
             # Transcribe using the detected API
             result = self.transcribe_fn(audio_data)
-            text = extract_text(result)
+            segments = result.get("segments") if isinstance(result, dict) else None
 
-            # Only print if different from last
-            if text and text != self.last_text:
-                self.transcription_count += 1
-                print_transcription(text, self.debug)
+            if segments is None:
+                # No timestamps to commit by; print what differs from last time
+                text = extract_text(result)
+                common = len(os.path.commonprefix((text, self.last_text)))
+                new_text = text[common:].strip()
                 self.last_text = text
+            else:
+                # Print only segments that ended well before the live edge;
+                # the last one may still grow, so it is decoded again next tick
+                stable_end = len(audio_data) / self.sample_rate - self.stable_margin
+                done = [seg for seg in segments if seg["end"] <= stable_end]
+                new_text = "".join(seg["text"] for seg in done).strip()
+                if done:
+                    self._committed = start + int(done[-1]["end"] * self.sample_rate)
+                elif not segments:
+                    # No speech decoded: commit all but the live edge
+                    self._committed = max(
+                        self._committed,
+                        end - int(self.stable_margin * self.sample_rate),
+                    )
+
+            if new_text:
+                self.transcription_count += 1
+                print_transcription(new_text, self.debug)
 
         except Exception as e:
             self.error_count += 1
@@ -224,6 +347,30 @@ class MacWhisperTranscriber:
 
                 traceback.print_exc()
 
+    def _ui_loop(self):
+        """Redraws the level meter at 10 Hz while recording."""
+        while self.running:
+            time.sleep(0.1)
+            print(METER_BARS[min(int(self.audio_level * 30), 30)], end="", flush=True)
+
+    def _worker_loop(self):
+        """Runs process_audio for each scheduled tick until a None arrives."""
+        while self._work.get() is not None:
+            self.process_audio()
+
+    def _has_speech(self, audio: np.ndarray) -> bool:
+        """True if at least two 30ms frames of the audio are voiced."""
+        usable = len(audio) // self.vad_frame * self.vad_frame
+        pcm = (audio[:usable] * 32767).astype(np.int16).tobytes()
+        step = self.vad_frame * 2  # bytes per int16 frame
+        voiced = 0
+        for i in range(0, len(pcm), step):
+            if self.vad.is_speech(pcm[i : i + step], self.sample_rate):
+                voiced += 1
+                if voiced >= 2:
+                    return True
+        return False
+
     def run(self):
         """Start real-time transcription."""
         print("\n" + "=" * 60)
@@ -235,25 +382,37 @@ class MacWhisperTranscriber:
 
         # List audio devices
         print("\n📊 Available audio devices:")
-        devices = sd.query_devices()
-        default_input = sd.default.device[0]
+        default_input, devices = _default_input()
         print(f"Default input: [{default_input}] {devices[default_input]['name']}")
 
         print("\n📝 Press Enter to start recording...")
         input()
 
         self.running = True
-        self.audio_buffer.clear()
+        self._write_idx = 0
+        self._filled = 0
+        self._last_submit = 0
+        self._committed = 0
+        self.last_text = ""
+        self._frames_since_tick = 0
         self.frames_processed = 0
         self.transcription_count = 0
         self.error_count = 0
 
+        worker = threading.Thread(target=self._worker_loop, daemon=True)
+        worker.start()
+        ingest = threading.Thread(target=self._ingest_loop, daemon=True)
+        ingest.start()
+        ui = threading.Thread(target=self._ui_loop, daemon=True)
+        if not self.debug:
+            ui.start()
+
         try:
-            with sd.InputStream(
+            with sd.RawInputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 blocksize=self.blocksize,
-                dtype="float32",
+                dtype="int16",
                 callback=self.audio_callback,
             ):
                 print("\n✅ Recording started! Speak now...")
@@ -283,15 +442,19 @@ class MacWhisperTranscriber:
 
         finally:
             self.running = False
+            # Drain recorded blocks first so no tick is scheduled after the
+            # worker's sentinel, then let an in-flight transcription finish
+            # before freeing MLX memory
+            self._raw_q.put(None)
+            ingest.join()
+            self._work.put(None)
+            worker.join()
+            if ui.is_alive():
+                ui.join()
 
             # Clean up MLX resources safely
             try:
-                import mlx.core as mx
-
-                if hasattr(mx, "metal"):
-                    mx.metal.clear_cache()
-                elif hasattr(mx, "clear_cache"):
-                    mx.clear_cache()
+                self._clear_cache()
             except Exception:
                 pass  # Ignore cleanup errors
 